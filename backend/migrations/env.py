@@ -0,0 +1,46 @@
+"""
+Alembic environment.
+
+Reads DATABASE_URL the same way backend/db.py does, unless a connection is
+passed in through Config.attributes. Migrations are written by
+hand (no autogenerate), so there is no target_metadata.
+
+Online mode only: the migrations inspect the live schema so they can adopt a
+database that was created from backend/sql/schema.sql.
+"""
+
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+
+load_dotenv()
+
+config = context.config
+# Tests call alembic in-process with their own connection; leave their logging alone.
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def run_migrations_online() -> None:
+    # Tests pass their own connection via Config.attributes["connection"].
+    conn = config.attributes.get("connection")
+    if conn is not None:
+        context.configure(connection=conn, target_metadata=None)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_engine(os.environ["DATABASE_URL"], pool_pre_ping=True)
+    with engine.connect() as conn:
+        context.configure(connection=conn, target_metadata=None)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    raise SystemExit("Offline (--sql) mode is not supported; these migrations inspect the live schema.")
+
+run_migrations_online()
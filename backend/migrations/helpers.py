@@ -0,0 +1,55 @@
+"""
+Schema checks shared by the migrations.
+
+Databases created from backend/sql/schema.sql (or by hand) may already have
+some tables and indexes, so migrations check the live schema before creating
+anything.
+"""
+
+from typing import Optional, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def has_index_on(table: str, columns: Sequence[str], unique: bool = False, exclude: Optional[str] = None) -> bool:
+    """True if some index/unique key on `table` (other than `exclude`) starts with `columns`."""
+    insp = sa.inspect(op.get_bind())
+    candidates = []
+    for ix in insp.get_indexes(table):
+        if ix["name"] != exclude:
+            candidates.append((ix["column_names"], bool(ix.get("unique"))))
+    for uq in insp.get_unique_constraints(table):
+        if uq["name"] != exclude:
+            candidates.append((uq["column_names"], True))
+
+    cols = list(columns)
+    for ix_cols, ix_unique in candidates:
+        if unique and not (ix_unique and list(ix_cols) == cols):
+            continue
+        if list(ix_cols[: len(cols)]) == cols:
+            return True
+    return False
+
+
+def create_index_if_missing(
+    name: str, table: str, columns: Sequence[str], unique: bool = False, exclude: Optional[str] = None
+) -> None:
+    """
+    Create an index unless an equivalent one already exists.
+
+    MySQL creates an index for every foreign key that lacks one, so an explicit
+    FK index would otherwise duplicate it.
+    """
+    if not has_index_on(table, columns, unique=unique, exclude=exclude):
+        op.create_index(name, table, list(columns), unique=unique)
+
+
+def drop_index_if_exists(name: str, table: str) -> None:
+    insp = sa.inspect(op.get_bind())
+    if any(ix["name"] == name for ix in insp.get_indexes(table)):
+        op.drop_index(name, table_name=table)
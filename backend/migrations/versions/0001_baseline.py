@@ -0,0 +1,96 @@
+"""Baseline: the tables in backend/sql/schema.sql.
+
+Tables that already exist are left alone, so a database created from
+schema.sql is adopted by running `alembic upgrade head` as-is.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.helpers import has_table
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("teams"):
+        op.create_table(
+            "teams",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(128), nullable=False),
+            sa.Column("short_name", sa.String(64)),
+            sa.Column("conference", sa.String(64)),
+            sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+            sa.UniqueConstraint("name", name="uq_team_name"),
+        )
+
+    if not has_table("players"):
+        op.create_table(
+            "players",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("team_id", sa.BigInteger, sa.ForeignKey("teams.id"), nullable=False),
+            sa.Column("first_name", sa.String(64)),
+            sa.Column("last_name", sa.String(64)),
+            sa.Column("bats", sa.Enum("R", "L", "S")),
+            sa.Column("throws", sa.Enum("R", "L")),
+            sa.Column("position", sa.String(16)),
+            sa.Column("class_year", sa.String(16)),
+            sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+        )
+
+    if not has_table("games"):
+        op.create_table(
+            "games",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("game_date", sa.Date, nullable=False),
+            sa.Column("season_year", sa.Integer, nullable=False),
+            sa.Column("home_team_id", sa.BigInteger, sa.ForeignKey("teams.id"), nullable=False),
+            sa.Column("away_team_id", sa.BigInteger, sa.ForeignKey("teams.id"), nullable=False),
+            sa.Column("home_score", sa.Integer),
+            sa.Column("away_score", sa.Integer),
+            sa.Column("status", sa.Enum("scheduled", "final", "in_progress"), server_default="final"),
+            sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+        )
+
+    if not has_table("batting_lines"):
+        op.create_table(
+            "batting_lines",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("game_id", sa.BigInteger, sa.ForeignKey("games.id"), nullable=False),
+            sa.Column("player_id", sa.BigInteger, sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("ab", sa.Integer, server_default="0"),
+            sa.Column("h", sa.Integer, server_default="0"),
+            sa.Column("_2b", sa.Integer, server_default="0"),
+            sa.Column("_3b", sa.Integer, server_default="0"),
+            sa.Column("hr", sa.Integer, server_default="0"),
+            sa.Column("bb", sa.Integer, server_default="0"),
+            sa.Column("so", sa.Integer, server_default="0"),
+            sa.Column("rbi", sa.Integer, server_default="0"),
+            sa.UniqueConstraint("game_id", "player_id", name="uq_batting_line"),
+        )
+
+    if not has_table("pitching_lines"):
+        op.create_table(
+            "pitching_lines",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("game_id", sa.BigInteger, sa.ForeignKey("games.id"), nullable=False),
+            sa.Column("player_id", sa.BigInteger, sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("outs_recorded", sa.Integer, server_default="0"),
+            sa.Column("h", sa.Integer, server_default="0"),
+            sa.Column("er", sa.Integer, server_default="0"),
+            sa.Column("bb", sa.Integer, server_default="0"),
+            sa.Column("so", sa.Integer, server_default="0"),
+            sa.UniqueConstraint("game_id", "player_id", name="uq_pitching_line"),
+        )
+
+
+def downgrade() -> None:
+    for table in ("pitching_lines", "batting_lines", "games", "players", "teams"):
+        op.drop_table(table)
@@ -0,0 +1,105 @@
+"""Season stat tables used by etl.load.season_repo.
+
+Creates player_batting_season / player_pitching_season with the
+(player_id, season_year) unique key their ON DUPLICATE KEY UPDATE upserts need.
+A season_year index backs whole-season reads from the DB (analytics queries
+filtering on season_year).
+
+If a table was already created by hand, it is kept. Rows that the upsert
+appended as duplicates are removed, keeping the newest row per key, and the
+missing keys are added.
+
+Revision ID: 0002_season_stat_tables
+Revises: 0001_baseline
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.helpers import create_index_if_missing, has_index_on, has_table
+
+revision = "0002_season_stat_tables"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def _dedupe_keep_newest(table: str) -> None:
+    op.execute(f"""
+        DELETE t FROM {table} t
+        JOIN {table} newer
+          ON newer.player_id = t.player_id
+         AND newer.season_year = t.season_year
+         AND newer.id > t.id
+    """)
+
+
+def upgrade() -> None:
+    if not has_table("player_batting_season"):
+        op.create_table(
+            "player_batting_season",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("player_id", sa.BigInteger, sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("season_year", sa.Integer, nullable=False),
+            sa.Column("ba", sa.Numeric(4, 3)),
+            sa.Column("obp", sa.Numeric(4, 3)),
+            sa.Column("slg", sa.Numeric(4, 3)),
+            sa.Column("ops", sa.Numeric(5, 3)),
+            sa.Column("gp", sa.Integer),
+            sa.Column("pa", sa.Integer),
+            sa.Column("ab", sa.Integer),
+            sa.Column("r", sa.Integer),
+            sa.Column("h", sa.Integer),
+            sa.Column("2b", sa.Integer),
+            sa.Column("3b", sa.Integer),
+            sa.Column("hr", sa.Integer),
+            sa.Column("rbi", sa.Integer),
+            sa.Column("hbp", sa.Integer),
+            sa.Column("bb", sa.Integer),
+            sa.Column("k", sa.Integer),
+            sa.Column("sb", sa.Integer),
+            sa.Column("cs", sa.Integer),
+            sa.Column("updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")),
+            sa.UniqueConstraint("player_id", "season_year", name="uq_batting_season"),
+        )
+    elif not has_index_on("player_batting_season", ["player_id", "season_year"], unique=True):
+        _dedupe_keep_newest("player_batting_season")
+        op.create_index("uq_batting_season", "player_batting_season", ["player_id", "season_year"], unique=True)
+
+    if not has_table("player_pitching_season"):
+        op.create_table(
+            "player_pitching_season",
+            sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+            sa.Column("player_id", sa.BigInteger, sa.ForeignKey("players.id"), nullable=False),
+            sa.Column("season_year", sa.Integer, nullable=False),
+            sa.Column("w", sa.Integer),
+            sa.Column("l", sa.Integer),
+            sa.Column("era", sa.Numeric(6, 2)),
+            sa.Column("app", sa.Integer),
+            sa.Column("gs", sa.Integer),
+            sa.Column("cg", sa.Integer),
+            sa.Column("sho", sa.Integer),
+            sa.Column("sv", sa.Integer),
+            sa.Column("outs_recorded", sa.Integer),
+            sa.Column("h", sa.Integer),
+            sa.Column("r", sa.Integer),
+            sa.Column("er", sa.Integer),
+            sa.Column("bb", sa.Integer),
+            sa.Column("k", sa.Integer),
+            sa.Column("hbp", sa.Integer),
+            sa.Column("ba_against", sa.Numeric(4, 3)),
+            sa.Column("updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")),
+            sa.UniqueConstraint("player_id", "season_year", name="uq_pitching_season"),
+        )
+    elif not has_index_on("player_pitching_season", ["player_id", "season_year"], unique=True):
+        _dedupe_keep_newest("player_pitching_season")
+        op.create_index("uq_pitching_season", "player_pitching_season", ["player_id", "season_year"], unique=True)
+
+    create_index_if_missing("ix_batting_season_year", "player_batting_season", ["season_year"])
+    create_index_if_missing("ix_pitching_season_year", "player_pitching_season", ["season_year"])
+
+
+def downgrade() -> None:
+    op.drop_table("player_pitching_season")
+    op.drop_table("player_batting_season")
@@ -0,0 +1,63 @@
+"""Unique key on players(team_id, first_name, last_name).
+
+etl.load.season_repo.upsert_player relies on ON DUPLICATE KEY UPDATE and then
+selects the id by (team_id, first_name, last_name). Without this key every
+sync appended a new player row and the SELECT scanned the table.
+
+Existing duplicates are merged into the lowest id first: lines and season
+rows are repointed to it (rows that would collide with one it already has are
+dropped), then the extra players are deleted. The key also serves as the
+index for the team_id foreign key.
+
+Revision ID: 0003_players_unique_name
+Revises: 0002_season_stat_tables
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+from backend.migrations.helpers import create_index_if_missing, has_index_on
+
+revision = "0003_players_unique_name"
+down_revision = "0002_season_stat_tables"
+branch_labels = None
+depends_on = None
+
+# Tables with a player_id FK and a unique key that includes it.
+PLAYER_CHILD_TABLES = ("batting_lines", "pitching_lines", "player_batting_season", "player_pitching_season")
+
+
+def upgrade() -> None:
+    if has_index_on("players", ["team_id", "first_name", "last_name"], unique=True):
+        return
+
+    op.execute("""
+        CREATE TEMPORARY TABLE _player_dupes AS
+        SELECT p.id AS dup_id, k.keep_id
+        FROM players p
+        JOIN (
+            SELECT team_id, first_name, last_name, MIN(id) AS keep_id
+            FROM players
+            GROUP BY team_id, first_name, last_name
+            HAVING COUNT(*) > 1
+        ) k ON k.team_id = p.team_id AND k.first_name = p.first_name AND k.last_name = p.last_name
+        WHERE p.id <> k.keep_id
+    """)
+    for table in PLAYER_CHILD_TABLES:
+        op.execute(f"""
+            UPDATE IGNORE {table} c
+            JOIN _player_dupes d ON c.player_id = d.dup_id
+            SET c.player_id = d.keep_id
+        """)
+        op.execute(f"DELETE c FROM {table} c JOIN _player_dupes d ON c.player_id = d.dup_id")
+    op.execute("DELETE p FROM players p JOIN _player_dupes d ON p.id = d.dup_id")
+    op.execute("DROP TEMPORARY TABLE _player_dupes")
+
+    op.create_index("uq_player_team_name", "players", ["team_id", "first_name", "last_name"], unique=True)
+
+
+def downgrade() -> None:
+    # MySQL may have dropped its implicit team_id FK index in favour of the
+    # unique key; the FK needs another index before the key can go.
+    create_index_if_missing("ix_players_team_id", "players", ["team_id"], exclude="uq_player_team_name")
+    op.drop_index("uq_player_team_name", table_name="players")
@@ -0,0 +1,28 @@
+"""Index for the GET /games season query.
+
+GET /games?season_year=... filters on the season and orders by date, so
+games(season_year, game_date) serves both the filter and the sort.
+
+Foreign-key columns (games.home_team_id, batting_lines.player_id, ...) are
+not indexed here: InnoDB already created an index for every foreign key in
+0001_baseline.
+
+Revision ID: 0004_hot_query_indexes
+Revises: 0003_players_unique_name
+Create Date: 2026-10-19
+"""
+
+from backend.migrations.helpers import create_index_if_missing, drop_index_if_exists
+
+revision = "0004_hot_query_indexes"
+down_revision = "0003_players_unique_name"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_if_missing("ix_games_season_date", "games", ["season_year", "game_date"])
+
+
+def downgrade() -> None:
+    drop_index_if_exists("ix_games_season_date", "games")
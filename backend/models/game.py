@@ -6,7 +6,7 @@ Maps the `games` table. Each game links to two teams via:
 - away_team_id -> teams.id
 """
 
-from sqlalchemy import Column, BigInteger, Integer, Date, Enum, TIMESTAMP, func
+from sqlalchemy import Column, BigInteger, Integer, Date, Enum, TIMESTAMP, func, select
 from backend.models.base import Base
 
 class Game(Base):
@@ -30,3 +30,25 @@ class Game(Base):
     )
 
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+# Columns returned by GET /games; must match the fields of GameOut.
+GAME_LIST_COLUMNS = (
+    Game.id,
+    Game.game_date,
+    Game.season_year,
+    Game.home_team_id,
+    Game.away_team_id,
+    Game.home_score,
+    Game.away_score,
+    Game.status,
+)
+GAME_LIST_KEYS = tuple(c.key for c in GAME_LIST_COLUMNS)
+
+
+def game_list_stmt(season_year=None):
+    """SELECT behind GET /games; `season_year` may be a value or a bindparam()."""
+    stmt = select(*GAME_LIST_COLUMNS)
+    if season_year is not None:
+        stmt = stmt.where(Game.season_year == season_year)
+    return stmt.order_by(Game.game_date.asc(), Game.id.asc())
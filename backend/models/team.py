@@ -19,3 +19,8 @@ class Team(Base):
     short_name = Column(String(64))
     conference = Column(String(64))
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+# Columns returned by GET /teams; must match the fields of TeamOut.
+TEAM_LIST_COLUMNS = (Team.id, Team.name, Team.short_name, Team.conference)
+TEAM_LIST_KEYS = tuple(c.key for c in TEAM_LIST_COLUMNS)
@@ -2,16 +2,20 @@
 Games API routes.
 
 Defines endpoints under `/games`:
+- GET /games  -> list games, optionally filtered by season (fast JSON path)
 - POST /games -> create a game row
 
 Uses a per-request SQLAlchemy Session via get_db().
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from backend.db_session import SessionLocal
-from backend.models.game import Game
+from backend.models.game import GAME_LIST_KEYS, Game, game_list_stmt
+from backend.routes.fast_json import json_list_response
 from backend.schemas.game import GameCreate, GameOut
 
 router = APIRouter(prefix="/games", tags=["Games"])
@@ -24,6 +28,17 @@ def get_db():
     finally:
         db.close()
 
+@router.get("/", response_model=list[GameOut])
+def get_games(season_year: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Return games ordered by date, optionally for a single season.
+
+    Selects plain rows (no ORM hydration) and encodes them directly to JSON.
+    The documented schema is still list[GameOut].
+    """
+    rows = db.execute(game_list_stmt(season_year)).all()
+    return json_list_response(rows, GAME_LIST_KEYS)
+
 @router.post("/", response_model=GameOut, status_code=201)
 def create_game(payload: GameCreate, db: Session = Depends(get_db)):
     """Insert a game into the database."""
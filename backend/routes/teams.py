@@ -2,16 +2,18 @@
 Teams API routes.
 
 Defines endpoints under `/teams`:
-- GET /teams  -> list teams
+- GET /teams  -> list teams (fast path: Core rows encoded straight to JSON)
 - POST /teams -> create a team
 
 Uses a per-request SQLAlchemy Session via the get_db() dependency.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from backend.db_session import SessionLocal
-from backend.models.team import Team
+from backend.models.team import TEAM_LIST_COLUMNS, TEAM_LIST_KEYS, Team
+from backend.routes.fast_json import json_list_response
 from backend.schemas.team import TeamCreate, TeamOut
 
 router = APIRouter(prefix="/teams", tags=["Teams"])
@@ -26,8 +28,14 @@ def get_db():
 
 @router.get("/", response_model=list[TeamOut])
 def get_teams(db: Session = Depends(get_db)):
-    """Return all teams."""
-    return db.query(Team).order_by(Team.id.asc()).all()
+    """
+    Return all teams.
+
+    Selects plain rows (no ORM hydration) and encodes them directly to JSON.
+    The documented schema is still list[TeamOut].
+    """
+    rows = db.execute(select(*TEAM_LIST_COLUMNS).order_by(Team.id.asc())).all()
+    return json_list_response(rows, TEAM_LIST_KEYS)
 
 @router.post("/", response_model=TeamOut, status_code=201)
 def create_team(payload: TeamCreate, db: Session = Depends(get_db)):
@@ -0,0 +1,95 @@
+"""
+Benchmark: ORM + Pydantic list serialization vs. the Core-rows + orjson fast path.
+
+Runs against an in-memory SQLite database so it needs no DATABASE_URL.
+It seeds N teams and N games, then times, per endpoint:
+- orm:  session.query(Model).all() -> validate each row via the *Out schema -> JSON
+        (what FastAPI does when a route returns ORM objects)
+- fast: select(columns) -> Core rows -> orjson bytes
+        (what GET /teams and GET /games do now)
+
+Run with: `python -m backend.scripts.bench_list_endpoints [rows] [repeats]`
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.game import GAME_LIST_COLUMNS, GAME_LIST_KEYS, Game
+from backend.models.team import TEAM_LIST_COLUMNS, TEAM_LIST_KEYS, Team
+from backend.routes.fast_json import rows_to_json
+from backend.schemas.game import GameOut
+from backend.schemas.team import TeamOut
+
+
+def _seed(Session, n: int) -> None:
+    # Explicit ids: SQLite only autoincrements INTEGER primary keys, not BIGINT.
+    with Session() as db:
+        db.add_all(
+            Team(id=i + 1, name=f"Team {i}", short_name=f"T{i}", conference="ACC")
+            for i in range(n)
+        )
+        start = date(2025, 2, 14)
+        db.add_all(
+            Game(
+                id=i + 1,
+                game_date=start + timedelta(days=i % 120),
+                season_year=2025,
+                home_team_id=i % n + 1,
+                away_team_id=(i + 1) % n + 1,
+                home_score=i % 11,
+                away_score=i % 7,
+                status="final",
+            )
+            for i in range(n)
+        )
+        db.commit()
+
+
+def _time(fn, repeats: int) -> float:
+    """Return the best wall time in milliseconds over `repeats` runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main(n: int = 5000, repeats: int = 5) -> None:
+    engine = create_engine("sqlite://")
+    Team.metadata.create_all(engine)
+    Game.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    _seed(Session, n)
+
+    cases = [
+        ("teams", Team, TeamOut, TEAM_LIST_COLUMNS, TEAM_LIST_KEYS),
+        ("games", Game, GameOut, GAME_LIST_COLUMNS, GAME_LIST_KEYS),
+    ]
+    print(f"rows={n} repeats={repeats} (best of, ms)")
+    for name, model, schema, columns, keys in cases:
+        adapter = TypeAdapter(list[schema])
+
+        def orm_path():
+            with Session() as db:
+                objs = db.query(model).order_by(model.id.asc()).all()
+                return adapter.dump_json(adapter.validate_python(objs, from_attributes=True))
+
+        def fast_path():
+            with Session() as db:
+                rows = db.execute(select(*columns).order_by(model.id.asc())).all()
+                return rows_to_json(rows, keys)
+
+        orm_ms = _time(orm_path, repeats)
+        fast_ms = _time(fast_path, repeats)
+        print(f"{name:6s} orm={orm_ms:8.2f}  fast={fast_ms:8.2f}  speedup={orm_ms / fast_ms:5.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
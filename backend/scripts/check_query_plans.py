@@ -0,0 +1,142 @@
+"""
+Check that the hot ETL and API queries use the indexes the migrations add.
+
+For each query this runs EXPLAIN against DATABASE_URL and checks that MySQL
+chose an index whose leading columns match the expected ones. Parameters are
+sampled from an existing row, because MySQL resolves unique-key lookups for
+missing rows at plan time and reports no key. So the check needs data: a query
+whose table is empty counts as a failure, not a pass.
+
+tests/test_migrations.py runs the same checks against a freshly migrated and
+seeded database. Run this script against a real, populated one after
+`alembic upgrade head`:
+  python -m backend.scripts.check_query_plans
+"""
+
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Connection
+
+from backend.models.game import game_list_stmt
+
+
+class HotQuery(NamedTuple):
+    revision: str           # migration that adds the index (0001: schema.sql / InnoDB FK indexes)
+    name: str
+    table: str
+    sql: str
+    sample_sql: str         # returns one row of bind params for `sql`
+    leading_columns: List[str]
+
+
+def _games_by_season_sql() -> str:
+    """The statement GET /games?season_year=... runs, with a :season_year bind."""
+    stmt = game_list_stmt(bindparam("season_year"))
+    return str(stmt.compile(dialect=mysql.dialect(paramstyle="named")))
+
+
+HOT_QUERIES = [
+    HotQuery(
+        "0001_baseline", "team by name (season_repo.get_or_create_team_id)", "teams",
+        "SELECT id FROM teams WHERE name = :name",
+        "SELECT name FROM teams LIMIT 1",
+        ["name"],
+    ),
+    HotQuery(
+        "0002_season_stat_tables", "batting season upsert key", "player_batting_season",
+        "SELECT id FROM player_batting_season WHERE player_id = :player_id AND season_year = :season_year",
+        "SELECT player_id, season_year FROM player_batting_season LIMIT 1",
+        ["player_id", "season_year"],
+    ),
+    HotQuery(
+        "0002_season_stat_tables", "pitching season upsert key", "player_pitching_season",
+        "SELECT id FROM player_pitching_season WHERE player_id = :player_id AND season_year = :season_year",
+        "SELECT player_id, season_year FROM player_pitching_season LIMIT 1",
+        ["player_id", "season_year"],
+    ),
+    HotQuery(
+        "0002_season_stat_tables", "batting rows for a season", "player_batting_season",
+        "SELECT * FROM player_batting_season WHERE season_year = :season_year",
+        "SELECT season_year FROM player_batting_season LIMIT 1",
+        ["season_year"],
+    ),
+    HotQuery(
+        "0003_players_unique_name", "player id lookup (season_repo.upsert_player)", "players",
+        "SELECT id FROM players WHERE team_id = :team_id AND first_name = :first_name AND last_name = :last_name",
+        "SELECT team_id, first_name, last_name FROM players LIMIT 1",
+        ["team_id", "first_name", "last_name"],
+    ),
+    HotQuery(
+        "0004_hot_query_indexes", "GET /games?season_year=", "games",
+        _games_by_season_sql(),
+        "SELECT season_year FROM games LIMIT 1",
+        ["season_year", "game_date"],
+    ),
+    HotQuery(
+        "0001_baseline", "games by home team (FK)", "games",
+        "SELECT id FROM games WHERE home_team_id = :home_team_id",
+        "SELECT home_team_id FROM games LIMIT 1",
+        ["home_team_id"],
+    ),
+    HotQuery(
+        "0001_baseline", "batting lines by player (FK)", "batting_lines",
+        "SELECT id FROM batting_lines WHERE player_id = :player_id",
+        "SELECT player_id FROM batting_lines LIMIT 1",
+        ["player_id"],
+    ),
+]
+
+
+class PlanResult(NamedTuple):
+    ok: bool
+    key: Optional[str]
+    key_columns: List[str]
+    plan_row: Dict
+
+
+def _index_columns(conn: Connection, table: str) -> Dict[str, List[str]]:
+    insp = inspect(conn)
+    cols = {ix["name"]: ix["column_names"] for ix in insp.get_indexes(table)}
+    cols["PRIMARY"] = insp.get_pk_constraint(table)["constrained_columns"]
+    return cols
+
+
+def explain(conn: Connection, q: HotQuery) -> Optional[PlanResult]:
+    """EXPLAIN `q` with params sampled from its table; None if the table is empty."""
+    sample = conn.execute(text(q.sample_sql)).mappings().first()
+    if sample is None:
+        return None
+
+    plan = [dict(r) for r in conn.execute(text("EXPLAIN " + q.sql), dict(sample)).mappings()]
+    row = next((r for r in plan if r.get("table") == q.table), plan[0])
+    key = row.get("key")
+    key_cols = _index_columns(conn, q.table).get(key, []) if key else []
+    ok = key_cols[: len(q.leading_columns)] == q.leading_columns
+    return PlanResult(ok, key, key_cols, row)
+
+
+def main() -> int:
+    from backend.db import engine
+
+    failed = 0
+    with engine.connect() as conn:
+        for q in HOT_QUERIES:
+            res = explain(conn, q)
+            if res is None:
+                failed += 1
+                print(f"FAIL {q.revision:26s} {q.name}: {q.table} is empty, nothing to check")
+                continue
+            failed += not res.ok
+            status = "ok  " if res.ok else "FAIL"
+            print(
+                f"{status} {q.revision:26s} {q.name}: key={res.key} "
+                f"type={res.plan_row.get('type')} rows={res.plan_row.get('rows')}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+-- Reference schema. Migrations in backend/migrations (Alembic) are the source
+-- of truth; apply them with `alembic upgrade head`. Keep this file in sync.
+
 CREATE TABLE teams (
   id BIGINT PRIMARY KEY AUTO_INCREMENT,
   name VARCHAR(128) NOT NULL,
@@ -17,7 +20,8 @@ CREATE TABLE players (
   position VARCHAR(16),
   class_year VARCHAR(16),
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  FOREIGN KEY (team_id) REFERENCES teams(id)
+  FOREIGN KEY (team_id) REFERENCES teams(id),
+  UNIQUE KEY uq_player_team_name (team_id, first_name, last_name)
 );
 
 CREATE TABLE games (
@@ -31,7 +35,8 @@ CREATE TABLE games (
   status ENUM('scheduled','final','in_progress') DEFAULT 'final',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY (home_team_id) REFERENCES teams(id),
-  FOREIGN KEY (away_team_id) REFERENCES teams(id)
+  FOREIGN KEY (away_team_id) REFERENCES teams(id),
+  KEY ix_games_season_date (season_year, game_date)
 );
 
 CREATE TABLE batting_lines (
@@ -64,3 +69,57 @@ CREATE TABLE pitching_lines (
   FOREIGN KEY (player_id) REFERENCES players(id),
   UNIQUE KEY uq_pitching_line (game_id, player_id)
 );
+
+CREATE TABLE player_batting_season (
+  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+  player_id BIGINT NOT NULL,
+  season_year INT NOT NULL,
+  ba DECIMAL(4,3),
+  obp DECIMAL(4,3),
+  slg DECIMAL(4,3),
+  ops DECIMAL(5,3),
+  gp INT,
+  pa INT,
+  ab INT,
+  r INT,
+  h INT,
+  `2b` INT,
+  `3b` INT,
+  hr INT,
+  rbi INT,
+  hbp INT,
+  bb INT,
+  k INT,
+  sb INT,
+  cs INT,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  FOREIGN KEY (player_id) REFERENCES players(id),
+  UNIQUE KEY uq_batting_season (player_id, season_year),
+  KEY ix_batting_season_year (season_year)
+);
+
+CREATE TABLE player_pitching_season (
+  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+  player_id BIGINT NOT NULL,
+  season_year INT NOT NULL,
+  w INT,
+  l INT,
+  era DECIMAL(6,2),
+  app INT,
+  gs INT,
+  cg INT,
+  sho INT,
+  sv INT,
+  outs_recorded INT,
+  h INT,
+  r INT,
+  er INT,
+  bb INT,
+  k INT,
+  hbp INT,
+  ba_against DECIMAL(4,3),
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  FOREIGN KEY (player_id) REFERENCES players(id),
+  UNIQUE KEY uq_pitching_season (player_id, season_year),
+  KEY ix_pitching_season_year (season_year)
+);
@@ -0,0 +1,65 @@
+"""
+Check `python -m etl` startup time against etl.cli.STARTUP_BUDGET_MS.
+
+For each command this runs `python -m etl <command> --help` in a fresh
+interpreter several times and takes the best wall time. It also runs once
+with `-X importtime` and fails if any heavy dependency was imported.
+
+Run with: `python -m etl.check_startup [repeats]`
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+from etl.cli import STARTUP_BUDGET_MS
+
+HEAVY_MODULES = {"pandas", "numpy", "bs4", "lxml", "httpx", "tenacity", "sqlalchemy", "dotenv"}
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _argv(command: str) -> List[str]:
+    return [sys.executable, "-m", "etl", *([command] if command else []), "--help"]
+
+
+def _best_ms(command: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        subprocess.run(_argv(command), cwd=REPO_ROOT, check=True, capture_output=True)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _heavy_imports(command: str) -> Set[str]:
+    argv = _argv(command)
+    proc = subprocess.run([argv[0], "-X", "importtime", *argv[1:]], cwd=REPO_ROOT, check=True, capture_output=True, text=True)
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        imported.add(name.split(".")[0])
+    return imported & HEAVY_MODULES
+
+
+def main(repeats: int = 5) -> int:
+    failed = 0
+    for command, budget in STARTUP_BUDGET_MS.items():
+        ms = _best_ms(command, repeats)
+        heavy = _heavy_imports(command)
+        ok = ms <= budget and not heavy
+        failed += not ok
+        label = command or "(none)"
+        extra = f"  heavy imports: {', '.join(sorted(heavy))}" if heavy else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {label:10s} {ms:7.1f} ms (budget {budget} ms){extra}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(a) for a in sys.argv[1:2]]))
@@ -0,0 +1,144 @@
+"""
+ETL command line: `python -m etl <command>`.
+
+Commands:
+- sync       fetch, archive, transform and load one team/season
+- crawl      sync every team listed in a CSV for one season
+- reprocess  re-transform the raw-page archive (no network), optionally load
+- export     write a season's columnar snapshot from the archive
+
+Startup:
+This module imports only argparse at load time. Each command imports its job
+module (and so pandas/bs4/httpx/numpy/SQLAlchemy) when it runs, and the DB
+engine is created on first query (etl.load.season_repo.get_engine), so
+`--help` and parse-only runs never pay for the DB. STARTUP_BUDGET_MS
+is checked by `python -m etl.check_startup`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+# Same defaults as etl.sources.raw_archive / etl.load.season_snapshot, spelled
+# out here so building the parser imports nothing heavy.
+ETL_DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# Max wall time (ms) for `python -m etl <command> --help`, including interpreter startup.
+STARTUP_BUDGET_MS = {
+    "": 100,
+    "sync": 100,
+    "crawl": 100,
+    "reprocess": 100,
+    "export": 100,
+}
+
+
+def _cmd_sync(args: argparse.Namespace) -> int:
+    from etl.jobs.sync_team_season import sync_team_season
+
+    n_bat, n_pit = sync_team_season(args.team_slug, args.team_name, args.season, args.html_file, args.conference)
+    print(f"{args.team_name} {args.season}: batting={n_bat} pitching={n_pit}")
+    return 0
+
+
+def _cmd_crawl(args: argparse.Namespace) -> int:
+    from etl.jobs.crawl_season import crawl_season, read_teams_csv
+
+    n_errors = 0
+    teams = read_teams_csv(args.teams_csv)
+    for team, counts, error in crawl_season(args.season, teams, args.delay):
+        if error:
+            n_errors += 1
+            print(f"ERROR {team['team_slug']}: {error}")
+        else:
+            print(f"{team['team_name']} {args.season}: batting={counts[0]} pitching={counts[1]}")
+    print(f"teams={len(teams)} errors={n_errors}")
+    return 1 if n_errors else 0
+
+
+def _cmd_reprocess(args: argparse.Namespace) -> int:
+    from etl.jobs.reprocess_archive import reprocess_archive
+
+    load_team_season = None
+    if args.load:
+        from etl.jobs.sync_team_season import load_team_season
+
+    n_pages = n_errors = 0
+    for res in reprocess_archive(args.root, args.season, args.team_slug, args.all_fetches, args.workers):
+        n_pages += 1
+        p = res.page
+        if res.error:
+            n_errors += 1
+            print(f"ERROR {p.season_year} {p.team_slug} {p.sha256[:12]}: {res.error}")
+            continue
+        if load_team_season:
+            load_team_season(p.team_name, p.season_year, res.batting, res.pitching)
+        print(f"{p.season_year} {p.team_slug} {p.fetched_on}: batting={len(res.batting)} pitching={len(res.pitching)}")
+
+    print(f"pages={n_pages} errors={n_errors}")
+    return 1 if n_errors else 0
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    from etl.jobs.export_season_snapshot import export_season_snapshot
+
+    res = export_season_snapshot(args.season, args.archive_root, args.snapshot_root, args.workers, args.allow_partial)
+    for e in res.errors:
+        print(f"ERROR {e}")
+    print(
+        f"season={args.season} pages={res.n_pages} batting={res.n_batting} "
+        f"pitching={res.n_pitching} errors={len(res.errors)}"
+    )
+    if not res.written:
+        reason = "no archived pages matched" if res.n_pages == 0 else "pages failed (use --allow-partial to write anyway)"
+        print(f"snapshot not written: {reason}")
+        return 1
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    archive_root = str(ETL_DATA_DIR / "archive")
+    snapshot_root = str(ETL_DATA_DIR / "snapshots")
+
+    ap = argparse.ArgumentParser(prog="python -m etl", description="NCAA baseball ETL.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("sync", help="Sync one team's season stats into the DB")
+    p.add_argument("--team-slug", required=True, help="D1Baseball URL slug, e.g. 'clemson'")
+    p.add_argument("--team-name", required=True, help="Team name as shown in the stats tables, e.g. 'Clemson'")
+    p.add_argument("--season", type=int, required=True)
+    p.add_argument("--conference", default=None)
+    p.add_argument("--html-file", default=None, help="Read the page from disk instead of fetching it")
+    p.set_defaults(func=_cmd_sync)
+
+    p = sub.add_parser("crawl", help="Sync every team in a CSV for one season")
+    p.add_argument("--season", type=int, required=True)
+    p.add_argument("--teams-csv", required=True, help="CSV with team_slug,team_name[,conference]")
+    p.add_argument("--delay", type=float, default=2.0, help="Seconds to wait between teams")
+    p.set_defaults(func=_cmd_crawl)
+
+    p = sub.add_parser("reprocess", help="Re-transform archived pages without the network")
+    p.add_argument("--root", default=archive_root)
+    p.add_argument("--season", type=int, default=None)
+    p.add_argument("--team-slug", default=None)
+    p.add_argument("--all-fetches", action="store_true", help="Process every fetch, not just the latest per season/team")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--load", action="store_true", help="Upsert the transformed records into the DB")
+    p.set_defaults(func=_cmd_reprocess)
+
+    p = sub.add_parser("export", help="Write a season's columnar snapshot from the archive")
+    p.add_argument("--season", type=int, required=True)
+    p.add_argument("--archive-root", default=archive_root)
+    p.add_argument("--snapshot-root", default=snapshot_root)
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--allow-partial", action="store_true", help="Write the snapshot even if some pages failed")
+    p.set_defaults(func=_cmd_export)
+
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,45 @@
+"""
+Job: sync a list of teams for one season.
+
+Reads a CSV with columns `team_slug,team_name[,conference]` and runs
+etl.jobs.sync_team_season for each row, one team at a time with a pause
+between requests. A failing team is reported and skipped.
+
+Run with:
+  python -m etl crawl --season 2025 --teams-csv etl/data/teams.csv
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from etl.jobs.sync_team_season import sync_team_season
+
+
+def read_teams_csv(path: str) -> List[Dict[str, str]]:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [row for row in csv.DictReader(f) if row.get("team_slug")]
+
+
+def crawl_season(
+    season_year: int,
+    teams: List[Dict[str, str]],
+    delay_s: float = 2.0,
+) -> Iterator[Tuple[Dict[str, str], Optional[Tuple[int, int]], Optional[str]]]:
+    """Yield (team_row, (n_batting, n_pitching) or None, error or None) per team."""
+    for i, team in enumerate(teams):
+        if i and delay_s > 0:
+            time.sleep(delay_s)
+        try:
+            counts = sync_team_season(
+                team["team_slug"],
+                team["team_name"],
+                season_year,
+                conference=team.get("conference") or None,
+            )
+        except Exception as e:
+            yield team, None, f"{type(e).__name__}: {e}"
+            continue
+        yield team, counts, None
@@ -0,0 +1,76 @@
+"""
+Job: export a season's normalized tables from the raw-page archive to a
+columnar snapshot (etl.load.season_snapshot).
+
+Steps:
+1) Re-transform the latest archived page per team for the season
+   (etl.jobs.reprocess_archive, in a process pool)
+2) Tag each record with its team and write the snapshot
+
+The existing snapshot is only replaced when at least one page matched and
+every page transformed cleanly; allow_partial (--allow-partial) writes
+despite page errors, dropping the failed teams.
+
+Run with:
+  python -m etl export --season 2025
+
+Read it back with:
+  from etl.load.season_snapshot import open_season_table
+  bat = open_season_table(2025, "batting")
+  hr, pa = bat.column("hr"), bat.column("pa")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from etl.jobs.reprocess_archive import reprocess_archive
+from etl.load.season_snapshot import SNAPSHOT_ROOT, write_season_snapshot
+from etl.sources.raw_archive import ARCHIVE_ROOT
+
+
+@dataclass
+class ExportResult:
+    n_pages: int = 0
+    n_batting: int = 0
+    n_pitching: int = 0
+    errors: List[str] = field(default_factory=list)
+    written: bool = False
+
+
+def export_season_snapshot(
+    season_year: int,
+    archive_root=ARCHIVE_ROOT,
+    snapshot_root=SNAPSHOT_ROOT,
+    workers: Optional[int] = None,
+    allow_partial: bool = False,
+) -> ExportResult:
+    """Write the season snapshot unless the archive gave nothing (or errors, see allow_partial)."""
+    result = ExportResult()
+    batting: List[Dict] = []
+    pitching: List[Dict] = []
+    for res in reprocess_archive(archive_root, season_year=season_year, workers=workers):
+        result.n_pages += 1
+        if res.error:
+            result.errors.append(f"{res.page.team_slug}: {res.error}")
+            continue
+        team = res.page.team_name
+        batting.extend({**rec, "team": team} for rec in res.batting)
+        pitching.extend({**rec, "team": team} for rec in res.pitching)
+
+    result.n_batting, result.n_pitching = len(batting), len(pitching)
+    if result.n_pages == 0 or (result.errors and not allow_partial):
+        return result
+
+    write_season_snapshot(season_year, batting, pitching, root=snapshot_root)
+    result.written = True
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    from etl.cli import main
+
+    sys.exit(main(["export", *sys.argv[1:]]))
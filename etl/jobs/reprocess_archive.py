@@ -0,0 +1,69 @@
+"""
+Job: re-run parse + transform over the raw-page archive, without the network.
+
+Use this to backfill a transform fix across seasons:
+1) List archived pages (etl.sources.raw_archive), by default only the latest
+   fetch per season/team
+2) Parse and normalize each page in a process pool
+3) Optionally upsert the results (--load); DB writes stay in the parent process
+
+Run with:
+  python -m etl reprocess --season 2025 --load
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from etl.jobs.sync_team_season import transform_html
+from etl.sources.raw_archive import ARCHIVE_ROOT, ArchivedPage, iter_archived_pages, latest_pages, read_page
+
+
+@dataclass
+class ReprocessResult:
+    page: ArchivedPage
+    batting: List[Dict]
+    pitching: List[Dict]
+    error: Optional[str] = None
+
+
+def _transform_page(page: ArchivedPage) -> ReprocessResult:
+    try:
+        batting, pitching = transform_html(read_page(page.path), page.team_name)
+    except Exception as e:
+        return ReprocessResult(page, [], [], error=f"{type(e).__name__}: {e}")
+    return ReprocessResult(page, batting, pitching)
+
+
+def reprocess_archive(
+    root=ARCHIVE_ROOT,
+    season_year: Optional[int] = None,
+    team_slug: Optional[str] = None,
+    all_fetches: bool = False,
+    workers: Optional[int] = None,
+) -> Iterator[ReprocessResult]:
+    """Yield one ReprocessResult per archived page, transformed in parallel."""
+    pages = list(iter_archived_pages(root, season_year, team_slug))
+    if not all_fetches:
+        pages = latest_pages(pages)
+    if not pages:
+        return
+
+    workers = workers or min(len(pages), os.cpu_count() or 1)
+    if workers <= 1:
+        yield from map(_transform_page, pages)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_transform_page, pages, chunksize=max(1, len(pages) // (workers * 4)))
+
+
+if __name__ == "__main__":
+    import sys
+
+    from etl.cli import main
+
+    sys.exit(main(["reprocess", *sys.argv[1:]]))
@@ -0,0 +1,83 @@
+"""
+Job: sync one team's season stats from D1Baseball into the database.
+
+Steps:
+1) Fetch the stats page (or read --html-file for development)
+2) Archive the raw page (etl.sources.raw_archive); --html-file pages are not
+   archived, so a hand-saved page never shadows a real fetch
+3) Parse the batting/pitching tables and normalize them into records
+4) Upsert team, players and season stat rows
+
+Run with:
+  python -m etl sync --team-slug clemson --team-name Clemson --season 2025
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from etl.sources.d1baseball import fetch_team_stats_html, parse_batting_pitching_tables, team_stats_url
+from etl.sources.raw_archive import archive_page
+from etl.transform.d1baseball_stats import normalize_batting, normalize_pitching
+
+
+def transform_html(html: str, team_name: str) -> Tuple[List[Dict], List[Dict]]:
+    """Parse a stats page and normalize it into (batting_records, pitching_records)."""
+    batting_raw, pitching_raw = parse_batting_pitching_tables(html)
+    return normalize_batting(batting_raw, team_name), normalize_pitching(pitching_raw, team_name)
+
+
+def load_team_season(
+    team_name: str,
+    season_year: int,
+    batting: List[Dict],
+    pitching: List[Dict],
+    conference: Optional[str] = None,
+) -> None:
+    """Upsert normalized records for one team/season."""
+    # Imported here so parse-only callers (e.g. reprocess workers) don't need a DB.
+    from etl.load import season_repo
+
+    team_id = season_repo.get_or_create_team_id(team_name, conference=conference)
+
+    # The pitching table has no POS column; reuse the batting one so a two-way
+    # player's position isn't overwritten with NULL.
+    positions: Dict[Tuple[str, str], Optional[str]] = {}
+    for rec in batting:
+        key = (rec["player_first"], rec["player_last"])
+        positions[key] = rec["pos"]
+        player_id = season_repo.upsert_player(team_id, rec["player_first"], rec["player_last"], rec["class_year"], rec["pos"])
+        season_repo.upsert_batting_season(player_id, season_year, rec)
+
+    for rec in pitching:
+        key = (rec["player_first"], rec["player_last"])
+        player_id = season_repo.upsert_player(team_id, rec["player_first"], rec["player_last"], rec["class_year"], positions.get(key))
+        season_repo.upsert_pitching_season(player_id, season_year, rec)
+
+
+def sync_team_season(
+    team_slug: str,
+    team_name: str,
+    season_year: int,
+    html_file: Optional[str] = None,
+    conference: Optional[str] = None,
+) -> Tuple[int, int]:
+    """Fetch, archive, transform and load one team/season. Returns (n_batting, n_pitching)."""
+    if html_file:
+        with open(html_file, "r", encoding="utf-8") as f:
+            html = f.read()
+    else:
+        html = fetch_team_stats_html(team_slug, season_year)
+        archive_page(html, team_slug, team_name, season_year, url=team_stats_url(team_slug, season_year))
+
+    batting, pitching = transform_html(html, team_name)
+    load_team_season(team_name, season_year, batting, pitching, conference=conference)
+    return len(batting), len(pitching)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from etl.cli import main
+
+    sys.exit(main(["sync", *sys.argv[1:]]))
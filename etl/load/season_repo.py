@@ -11,22 +11,35 @@ Assumes tables exist:
 - players
 - player_batting_season
 - player_pitching_season
+
+The engine is created on first use (get_engine), so importing this module
+needs neither a DATABASE_URL nor a connection.
 """
 
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    from dotenv import load_dotenv
+    from sqlalchemy import create_engine
 
-load_dotenv()
-ENGINE = create_engine(os.environ["DATABASE_URL"], pool_pre_ping=True)
+    load_dotenv()
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        raise SystemExit("DATABASE_URL is not set; it is needed to load into the DB (sync/crawl, reprocess --load).")
+    return create_engine(url, pool_pre_ping=True)
 
 
 def get_or_create_team_id(team_name: str, short_name: Optional[str] = None, conference: Optional[str] = None) -> int:
-    with ENGINE.begin() as conn:
+    with get_engine().begin() as conn:
         row = conn.execute(text("SELECT id FROM teams WHERE name = :n"), {"n": team_name}).fetchone()
         if row:
             return int(row[0])
@@ -39,7 +52,7 @@ def get_or_create_team_id(team_name: str, short_name: Optional[str] = None, conf
 
 
 def upsert_player(team_id: int, first: str, last: str, class_year: Optional[str], pos: Optional[str]) -> int:
-    with ENGINE.begin() as conn:
+    with get_engine().begin() as conn:
         conn.execute(
             text("""
                 INSERT INTO players (team_id, first_name, last_name, class_year, position)
@@ -62,7 +75,7 @@ def upsert_player(team_id: int, first: str, last: str, class_year: Optional[str]
 
 
 def upsert_batting_season(player_id: int, season_year: int, r: dict) -> None:
-    with ENGINE.begin() as conn:
+    with get_engine().begin() as conn:
         conn.execute(
             text("""
                 INSERT INTO player_batting_season (
@@ -107,7 +120,7 @@ def upsert_batting_season(player_id: int, season_year: int, r: dict) -> None:
 
 
 def upsert_pitching_season(player_id: int, season_year: int, r: dict) -> None:
-    with ENGINE.begin() as conn:
+    with get_engine().begin() as conn:
         conn.execute(
             text("""
                 INSERT INTO player_pitching_season (
@@ -0,0 +1,249 @@
+"""
+Load: columnar on-disk snapshots of a season's normalized batting/pitching tables.
+
+Responsibilities:
+- Write each season's records as one typed NumPy array per column, so analytics
+  can memory-map a season and touch only the columns it needs, with no DB.
+- Read them back (`open_season_table`) without copying column data.
+
+Layout:
+  <root>/season=<year>/CURRENT                                   (name of the live version)
+  <root>/season=<year>/<version>/<table>/manifest.json
+  <root>/season=<year>/<version>/<table>/<column>.npy            (int / float columns)
+  <root>/season=<year>/<version>/<table>/<column>.codes.npy      (string columns)
+  <root>/season=<year>/<version>/<table>/<column>.dict.json      (string column dictionary)
+
+Rewrites:
+Each write goes into a new version directory and then atomically replaces
+CURRENT; older versions are removed afterwards. A SeasonTable maps all of its
+column files when opened, so a reader keeps a consistent view of the version
+it opened even after that version is deleted (pages still load lazily).
+
+Types:
+- int:   int32, nulls stored as INT_NULL
+- float: float64, nulls stored as NaN
+- str:   int32 codes into a sorted dictionary, nulls stored as -1
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SNAPSHOT_ROOT = Path(__file__).resolve().parents[1] / "data" / "snapshots"
+
+INT_NULL = np.iinfo(np.int32).min
+
+BATTING_COLUMNS: List[Tuple[str, str]] = [
+    ("team", "str"),
+    ("player_first", "str"),
+    ("player_last", "str"),
+    ("class_year", "str"),
+    ("pos", "str"),
+    ("ba", "float"),
+    ("obp", "float"),
+    ("slg", "float"),
+    ("ops", "float"),
+    ("gp", "int"),
+    ("pa", "int"),
+    ("ab", "int"),
+    ("r", "int"),
+    ("h", "int"),
+    ("2b", "int"),
+    ("3b", "int"),
+    ("hr", "int"),
+    ("rbi", "int"),
+    ("hbp", "int"),
+    ("bb", "int"),
+    ("k", "int"),
+    ("sb", "int"),
+    ("cs", "int"),
+]
+
+PITCHING_COLUMNS: List[Tuple[str, str]] = [
+    ("team", "str"),
+    ("player_first", "str"),
+    ("player_last", "str"),
+    ("class_year", "str"),
+    ("w", "int"),
+    ("l", "int"),
+    ("era", "float"),
+    ("app", "int"),
+    ("gs", "int"),
+    ("cg", "int"),
+    ("sho", "int"),
+    ("sv", "int"),
+    ("outs_recorded", "int"),
+    ("h", "int"),
+    ("r", "int"),
+    ("er", "int"),
+    ("bb", "int"),
+    ("k", "int"),
+    ("hbp", "int"),
+    ("ba_against", "float"),
+]
+
+TABLE_COLUMNS = {"batting": BATTING_COLUMNS, "pitching": PITCHING_COLUMNS}
+
+
+def _table_dir(root: Path, season_year: int, table: str) -> Path:
+    return Path(root) / f"season={season_year}" / table
+
+
+def _encode_strings(values: List[Optional[str]]) -> Tuple[np.ndarray, List[str]]:
+    dictionary = sorted({v for v in values if v is not None})
+    index = {v: i for i, v in enumerate(dictionary)}
+    codes = np.fromiter((index[v] if v is not None else -1 for v in values), dtype=np.int32, count=len(values))
+    return codes, dictionary
+
+
+def _write_table(out_dir: Path, records: Sequence[Dict], columns: List[Tuple[str, str]]) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    n = len(records)
+    for name, kind in columns:
+        values = [r.get(name) for r in records]
+        if kind == "int":
+            arr = np.fromiter((INT_NULL if v is None else v for v in values), dtype=np.int32, count=n)
+            np.save(out_dir / f"{name}.npy", arr)
+        elif kind == "float":
+            arr = np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64, count=n)
+            np.save(out_dir / f"{name}.npy", arr)
+        else:
+            codes, dictionary = _encode_strings(values)
+            np.save(out_dir / f"{name}.codes.npy", codes)
+            (out_dir / f"{name}.dict.json").write_text(json.dumps(dictionary), encoding="utf-8")
+
+    manifest = {"n_rows": n, "columns": [{"name": name, "kind": kind} for name, kind in columns]}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def _season_dir(root: Path, season_year: int) -> Path:
+    return Path(root) / f"season={season_year}"
+
+
+def write_season_snapshot(
+    season_year: int,
+    batting: Iterable[Dict],
+    pitching: Iterable[Dict],
+    root: Path = SNAPSHOT_ROOT,
+) -> Path:
+    """
+    Write a season snapshot as a new version and return its directory.
+
+    Records are the normalized dicts from etl.transform.d1baseball_stats plus a
+    "team" key. The version only becomes visible when CURRENT is replaced, so
+    a reader never sees a half-written snapshot or a missing season.
+    """
+    season_dir = _season_dir(root, season_year)
+    version = f"v{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+    version_dir = season_dir / version
+
+    _write_table(version_dir / "batting", list(batting), BATTING_COLUMNS)
+    _write_table(version_dir / "pitching", list(pitching), PITCHING_COLUMNS)
+
+    tmp = season_dir / f"CURRENT.{uuid.uuid4().hex[:8]}.tmp"
+    tmp.write_text(version, encoding="utf-8")
+    os.replace(tmp, season_dir / "CURRENT")
+
+    # Open readers keep their mapped files; on platforms that refuse to delete
+    # mapped files the old version is retried on the next write.
+    for old in season_dir.iterdir():
+        if old.is_dir() and old.name != version:
+            shutil.rmtree(old, ignore_errors=True)
+    return version_dir
+
+
+class SeasonTable:
+    """
+    Memory-mapped view over one snapshot table.
+
+    Every column file is mapped in __init__ so the view stays consistent if the
+    snapshot is rewritten; no column data is read until it is touched.
+    """
+
+    def __init__(self, table_dir: Path):
+        self.dir = Path(table_dir)
+        manifest = json.loads((self.dir / "manifest.json").read_text(encoding="utf-8"))
+        self.n_rows: int = manifest["n_rows"]
+        self.kinds: Dict[str, str] = {c["name"]: c["kind"] for c in manifest["columns"]}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._dicts: Dict[str, np.ndarray] = {}
+        for name, kind in self.kinds.items():
+            if kind == "str":
+                self._arrays[name] = np.load(self.dir / f"{name}.codes.npy", mmap_mode="r")
+                words = json.loads((self.dir / f"{name}.dict.json").read_text(encoding="utf-8"))
+                self._dicts[name] = np.array(words, dtype=object)
+            else:
+                self._arrays[name] = np.load(self.dir / f"{name}.npy", mmap_mode="r")
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.kinds)
+
+    def codes(self, name: str) -> np.ndarray:
+        """int32 dictionary codes of a string column (-1 = null)."""
+        if self.kinds[name] != "str":
+            raise ValueError(f"Column {name!r} is not a string column")
+        return self._arrays[name]
+
+    def dictionary(self, name: str) -> np.ndarray:
+        return self._dicts[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a column. Numeric columns are read-only memory maps; string
+        columns are decoded to an object array (None for nulls).
+        """
+        kind = self.kinds[name]
+        if kind != "str":
+            return self._arrays[name]
+        codes = self.codes(name)
+        out = np.empty(self.n_rows, dtype=object)
+        valid = codes >= 0
+        out[valid] = self.dictionary(name)[codes[valid]]
+        return out
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None):
+        """Build a DataFrame from the requested columns (pandas is imported lazily)."""
+        import pandas as pd
+
+        data = {}
+        for name in columns or self.columns:
+            kind = self.kinds[name]
+            if kind == "str":
+                data[name] = pd.Categorical.from_codes(np.asarray(self.codes(name)), categories=self.dictionary(name))
+            elif kind == "int":
+                col = np.array(self.column(name))
+                data[name] = pd.arrays.IntegerArray(col, mask=col == INT_NULL)
+            else:
+                data[name] = np.asarray(self.column(name))
+        return pd.DataFrame(data)
+
+
+def open_season_table(season_year: int, table: str, root: Path = SNAPSHOT_ROOT) -> SeasonTable:
+    """Open the 'batting' or 'pitching' table of the current season snapshot."""
+    if table not in TABLE_COLUMNS:
+        raise ValueError(f"Unknown table {table!r}; expected one of {sorted(TABLE_COLUMNS)}")
+
+    season_dir = _season_dir(root, season_year)
+    # A concurrent rewrite can delete the version named in CURRENT between
+    # reading the pointer and mapping the files; re-read the pointer then.
+    retries = 2
+    while True:
+        try:
+            version = (season_dir / "CURRENT").read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No snapshot for season {season_year} under {root}") from None
+        try:
+            return SeasonTable(season_dir / version / table)
+        except FileNotFoundError:
+            if retries == 0:
+                raise
+            retries -= 1
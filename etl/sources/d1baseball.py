@@ -5,6 +5,12 @@ Responsibilities:
 - Fetch the stats page HTML in-memory (no writing to disk).
 - Parse the batting and pitching tables by their DOM ids.
 
+httpx, tenacity, pandas and bs4 are imported inside the functions that use
+them, so importing this module (e.g. for CLI --help) stays cheap.
+
+Jobs persist fetched pages through `etl.sources.raw_archive` so they can be
+re-parsed later without hitting the network.
+
 Notes:
 - If D1Baseball blocks automated requests (e.g., 403), this module will raise
   a clear error. You can then provide HTML via --html-file for development.
@@ -12,21 +18,33 @@ Notes:
 
 from __future__ import annotations
 
-from typing import List, Tuple
-
-import httpx
-import pandas as pd
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import TYPE_CHECKING, List, Tuple
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from bs4 import BeautifulSoup
 
 BAT_TABLE_ID = "batting-stats"
 PIT_TABLE_ID = "pitching-stats"
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
+def team_stats_url(team_slug: str, season_year: int) -> str:
+    return f"https://d1baseball.com/team/{team_slug}/{season_year}/stats/"
+
+
 def fetch_team_stats_html(team_slug: str, season_year: int, timeout_s: float = 20.0) -> str:
-    url = f"https://d1baseball.com/team/{team_slug}/{season_year}/stats/"
+    from tenacity import Retrying, stop_after_attempt, wait_exponential
+
+    retrying = Retrying(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8), reraise=True)
+    for attempt in retrying:
+        with attempt:
+            return _fetch_once(team_slug, season_year, timeout_s)
+
+
+def _fetch_once(team_slug: str, season_year: int, timeout_s: float) -> str:
+    import httpx
+
+    url = team_stats_url(team_slug, season_year)
     headers = {
         # Honest, minimal headers. We are not trying to bypass restrictions.
         "User-Agent": "Mozilla/5.0",
@@ -40,6 +58,8 @@ def fetch_team_stats_html(team_slug: str, season_year: int, timeout_s: float = 2
 
 
 def _parse_table_by_id(soup: BeautifulSoup, table_id: str) -> pd.DataFrame:
+    import pandas as pd
+
     table = soup.find("table", id=table_id)
     if not table:
         return pd.DataFrame()
@@ -63,6 +83,8 @@ def _parse_table_by_id(soup: BeautifulSoup, table_id: str) -> pd.DataFrame:
 
 
 def parse_batting_pitching_tables(html: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "lxml")
     batting_df = _parse_table_by_id(soup, BAT_TABLE_ID)
     pitching_df = _parse_table_by_id(soup, PIT_TABLE_ID)
@@ -0,0 +1,139 @@
+"""
+Source: content-addressed, compressed archive of fetched D1Baseball pages.
+
+Responsibilities:
+- Store every fetched stats page gzip-compressed under
+  `<root>/season=<year>/team=<slug>/fetched=<YYYY-MM-DD>/<sha256>.html.gz`
+  with a small `<sha256>.json` sidecar (team name, url, fetch time).
+- Skip the write when the same content is already in that partition.
+- List archived pages so jobs can re-parse them without the network.
+
+Notes:
+- The sha256 is of the raw HTML, so identical pages fetched on the same day
+  dedupe to a single file.
+- The default root is `etl/data/archive`; pass `root=` to use another location.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ARCHIVE_ROOT = Path(__file__).resolve().parents[1] / "data" / "archive"
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    path: Path
+    sha256: str
+    season_year: int
+    team_slug: str
+    team_name: str
+    fetched_on: date
+    fetched_at: datetime
+
+
+def _partition_dir(root: Path, season_year: int, team_slug: str, fetched_on: date) -> Path:
+    return root / f"season={season_year}" / f"team={team_slug}" / f"fetched={fetched_on.isoformat()}"
+
+
+def _sidecar_path(page_path: Path) -> Path:
+    return page_path.with_name(page_path.name.replace(".html.gz", ".json"))
+
+
+def archive_page(
+    html: str,
+    team_slug: str,
+    team_name: str,
+    season_year: int,
+    url: Optional[str] = None,
+    fetched_at: Optional[datetime] = None,
+    root: Path = ARCHIVE_ROOT,
+) -> Path:
+    """Write `html` into the archive (if not already there) and return its path."""
+    fetched_at = fetched_at or datetime.now(timezone.utc)
+    data = html.encode("utf-8")
+    sha = hashlib.sha256(data).hexdigest()
+
+    part = _partition_dir(Path(root), season_year, team_slug, fetched_at.date())
+    path = part / f"{sha}.html.gz"
+    sidecar = _sidecar_path(path)
+    if path.exists() and sidecar.exists():
+        return path
+
+    part.mkdir(parents=True, exist_ok=True)
+    # Sidecar first, then the page, each via temp name + rename: a crash can
+    # leave an orphan sidecar (ignored by readers) but never a page without one.
+    # A page left without a sidecar by an older run is repaired here.
+    if not sidecar.exists():
+        meta = {
+            "sha256": sha,
+            "team_slug": team_slug,
+            "team_name": team_name,
+            "season_year": season_year,
+            "url": url,
+            "fetched_at": fetched_at.isoformat(),
+        }
+        tmp_meta = sidecar.with_suffix(".json.tmp")
+        tmp_meta.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        tmp_meta.replace(sidecar)
+
+    if not path.exists():
+        tmp = path.with_suffix(".tmp")
+        with gzip.open(tmp, "wb", compresslevel=9) as f:
+            f.write(data)
+        tmp.replace(path)
+
+    return path
+
+
+def read_page(path: Path) -> str:
+    with gzip.open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def iter_archived_pages(
+    root: Path = ARCHIVE_ROOT,
+    season_year: Optional[int] = None,
+    team_slug: Optional[str] = None,
+) -> Iterator[ArchivedPage]:
+    """
+    Yield every archived page, optionally limited to one season and/or team.
+
+    A page whose sidecar is missing is logged and skipped.
+    """
+    season_glob = f"season={season_year}" if season_year is not None else "season=*"
+    team_glob = f"team={team_slug}" if team_slug is not None else "team=*"
+    for path in sorted(Path(root).glob(f"{season_glob}/{team_glob}/fetched=*/*.html.gz")):
+        sidecar = _sidecar_path(path)
+        if not sidecar.exists():
+            log.warning("Skipping archived page without sidecar: %s", path)
+            continue
+        meta = json.loads(sidecar.read_text(encoding="utf-8"))
+        yield ArchivedPage(
+            path=path,
+            sha256=meta["sha256"],
+            season_year=int(meta["season_year"]),
+            team_slug=meta["team_slug"],
+            team_name=meta["team_name"],
+            fetched_on=date.fromisoformat(path.parent.name.split("=", 1)[1]),
+            fetched_at=datetime.fromisoformat(meta["fetched_at"]),
+        )
+
+
+def latest_pages(pages: List[ArchivedPage]) -> List[ArchivedPage]:
+    """Keep only the most recent fetch per (season, team)."""
+    latest: Dict[Tuple[int, str], ArchivedPage] = {}
+    for p in pages:
+        key = (p.season_year, p.team_slug)
+        if key not in latest or p.fetched_at > latest[key].fetched_at:
+            latest[key] = p
+    return sorted(latest.values(), key=lambda p: (p.season_year, p.team_slug))
@@ -15,9 +15,10 @@ Each record contains: player_first, player_last, class_year, pos, plus stat fiel
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def split_name(full: str) -> Tuple[str, str]:
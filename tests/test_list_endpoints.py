@@ -0,0 +1,75 @@
+"""
+Fast-path list endpoints: the selected columns must stay in step with the
+response schemas, because the JSON is returned without Pydantic validation.
+"""
+
+import os
+from datetime import date
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+sa = pytest.importorskip("sqlalchemy")
+
+# backend.db builds its engine at import time; the tests use their own engine.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from backend.models.game import GAME_LIST_KEYS, Game  # noqa: E402
+from backend.models.team import TEAM_LIST_KEYS, Team  # noqa: E402
+from backend.routes.games import get_games  # noqa: E402
+from backend.routes.teams import get_teams  # noqa: E402
+from backend.schemas.game import GameOut  # noqa: E402
+from backend.schemas.team import TeamOut  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    engine = sa.create_engine("sqlite://")
+    Team.metadata.create_all(engine)
+    Game.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with Session() as session:
+        # Explicit ids: SQLite only autoincrements INTEGER primary keys, not BIGINT.
+        session.add_all([
+            Team(id=1, name="Clemson", short_name="CLEM", conference="ACC"),
+            Team(id=2, name="Duke", short_name=None, conference=None),
+        ])
+        session.add_all([
+            Game(id=1, game_date=date(2025, 2, 14), season_year=2025, home_team_id=1, away_team_id=2,
+                 home_score=7, away_score=3, status="final"),
+            Game(id=2, game_date=date(2025, 2, 15), season_year=2025, home_team_id=2, away_team_id=1,
+                 status="scheduled"),
+            Game(id=3, game_date=date(2024, 3, 1), season_year=2024, home_team_id=1, away_team_id=2,
+                 home_score=1, away_score=2, status="final"),
+        ])
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_list_keys_match_response_schemas():
+    assert set(TEAM_LIST_KEYS) == set(TeamOut.model_fields)
+    assert set(GAME_LIST_KEYS) == set(GameOut.model_fields)
+
+
+def test_get_teams_body_validates_as_team_out(db):
+    resp = get_teams(db=db)
+    assert resp.media_type == "application/json"
+
+    teams = TypeAdapter(list[TeamOut]).validate_json(resp.body)
+    assert [t.id for t in teams] == [1, 2]
+    assert teams[1] == TeamOut(id=2, name="Duke")
+
+
+def test_get_games_body_validates_as_game_out(db):
+    games = TypeAdapter(list[GameOut]).validate_json(get_games(db=db).body)
+    assert [g.id for g in games] == [3, 1, 2]  # ordered by game_date
+    assert games[1].game_date == date(2025, 2, 14)
+    assert games[2].home_score is None
+
+    season = TypeAdapter(list[GameOut]).validate_json(get_games(season_year=2025, db=db).body)
+    assert [g.id for g in season] == [1, 2]
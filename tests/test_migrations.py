@@ -0,0 +1,257 @@
+"""
+Migration tests: each revision's indexes are used by the hot ETL/API queries.
+
+For every revision that adds an index, the hot queries are EXPLAINed on a
+seeded database at its down_revision (must NOT use the index) and again after
+upgrading to it (must use it). Queries served by the baseline schema are
+checked at head.
+
+These need a MySQL server and are skipped unless DATABASE_URL points to one
+(see .github/workflows/tests.yml). Every test runs in its own scratch
+database on that server (created and dropped here), so the database named in
+DATABASE_URL is never touched.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL.startswith("mysql"),
+    reason="needs DATABASE_URL pointing to a MySQL server",
+)
+
+pytest.importorskip("alembic")
+sa = pytest.importorskip("sqlalchemy")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from alembic.script import ScriptDirectory  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+
+from backend.scripts.check_query_plans import HOT_QUERIES, explain  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+N_TEAMS = 20
+PLAYERS_PER_TEAM = 15
+SEASONS = range(2016, 2026)
+GAMES_PER_SEASON = 40
+
+
+@contextmanager
+def scratch_db():
+    url = make_url(DATABASE_URL)
+    name = f"{url.database or 'ncaa'}_migtest_{uuid.uuid4().hex[:8]}"
+    server = sa.create_engine(url.set(database=None))
+    with server.begin() as conn:
+        conn.execute(sa.text(f"CREATE DATABASE `{name}`"))
+    engine = sa.create_engine(url.set(database=name))
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        with server.begin() as conn:
+            conn.execute(sa.text(f"DROP DATABASE `{name}`"))
+        server.dispose()
+
+
+def alembic_config() -> Config:
+    cfg = Config(str(REPO_ROOT / "alembic.ini"))
+    cfg.set_main_option("script_location", str(REPO_ROOT / "backend" / "migrations"))
+    return cfg
+
+
+def migrate(engine, revision: str, downgrade: bool = False) -> None:
+    cfg = alembic_config()
+    with engine.begin() as conn:
+        cfg.attributes["connection"] = conn
+        (command.downgrade if downgrade else command.upgrade)(cfg, revision)
+
+
+def create_handmade_season_tables(engine) -> None:
+    """Season tables as they were created by hand before 0002: no unique key."""
+    with engine.begin() as conn:
+        for table in ("player_batting_season", "player_pitching_season"):
+            conn.execute(sa.text(f"""
+                CREATE TABLE {table} (
+                  id BIGINT PRIMARY KEY AUTO_INCREMENT,
+                  player_id BIGINT NOT NULL,
+                  season_year INT NOT NULL,
+                  hr INT,
+                  FOREIGN KEY (player_id) REFERENCES players(id)
+                )
+            """))
+
+
+def analyze(engine) -> None:
+    with engine.begin() as conn:
+        for table in sa.inspect(engine).get_table_names():
+            if table != "alembic_version":
+                conn.execute(sa.text(f"ANALYZE TABLE {table}"))
+
+
+def seed(engine) -> None:
+    """
+    Enough rows, spread over teams and seasons, for MySQL to prefer the indexes.
+
+    Works at any revision: the season tables are only seeded if they exist.
+    """
+    teams = [{"id": t, "name": f"Team {t}"} for t in range(1, N_TEAMS + 1)]
+    players = [
+        {"id": (t - 1) * PLAYERS_PER_TEAM + i, "team_id": t, "first": f"First{i}", "last": f"Last{t}"}
+        for t in range(1, N_TEAMS + 1)
+        for i in range(1, PLAYERS_PER_TEAM + 1)
+    ]
+    games = []
+    for s_idx, season in enumerate(SEASONS):
+        for g in range(GAMES_PER_SEASON):
+            games.append({
+                "id": s_idx * GAMES_PER_SEASON + g + 1,
+                "game_date": date(season, 2, 14) + timedelta(days=g),
+                "season_year": season,
+                "home": g % N_TEAMS + 1,
+                "away": (g + 1) % N_TEAMS + 1,
+            })
+    lines = [
+        {"game_id": gm["id"], "player_id": (gm["home"] - 1) * PLAYERS_PER_TEAM + i}
+        for gm in games
+        for i in range(1, 4)
+    ]
+    season_rows = [{"player_id": p["id"], "season_year": s} for p in players for s in SEASONS]
+
+    with engine.begin() as conn:
+        conn.execute(sa.text("INSERT INTO teams (id, name) VALUES (:id, :name)"), teams)
+        conn.execute(
+            sa.text("INSERT INTO players (id, team_id, first_name, last_name) VALUES (:id, :team_id, :first, :last)"),
+            players,
+        )
+        conn.execute(
+            sa.text("""
+                INSERT INTO games (id, game_date, season_year, home_team_id, away_team_id)
+                VALUES (:id, :game_date, :season_year, :home, :away)
+            """),
+            games,
+        )
+        conn.execute(sa.text("INSERT INTO batting_lines (game_id, player_id) VALUES (:game_id, :player_id)"), lines)
+        conn.execute(sa.text("INSERT INTO pitching_lines (game_id, player_id) VALUES (:game_id, :player_id)"), lines)
+        for table in ("player_batting_season", "player_pitching_season"):
+            if sa.inspect(conn).has_table(table):
+                conn.execute(
+                    sa.text(f"INSERT INTO {table} (player_id, season_year) VALUES (:player_id, :season_year)"),
+                    season_rows,
+                )
+    analyze(engine)
+
+
+@pytest.fixture(scope="module")
+def migrated_engine():
+    with scratch_db() as engine:
+        migrate(engine, "head")
+        seed(engine)
+        yield engine
+
+
+@pytest.mark.parametrize("query", HOT_QUERIES, ids=[f"{q.revision}:{q.name}" for q in HOT_QUERIES])
+def test_hot_query_uses_index_at_head(migrated_engine, query):
+    with migrated_engine.connect() as conn:
+        res = explain(conn, query)
+
+    assert res is not None, f"{query.table} is empty; the plan was not checked"
+    assert res.ok, (
+        f"{query.name}: expected an index on {query.leading_columns}, "
+        f"got key={res.key} ({res.key_columns}), plan={res.plan_row}"
+    )
+
+
+INDEX_REVISIONS = sorted({q.revision for q in HOT_QUERIES} - {"0001_baseline"})
+
+
+@pytest.mark.parametrize("revision", INDEX_REVISIONS)
+def test_revision_adds_the_index_its_queries_use(revision):
+    down_revision = ScriptDirectory.from_config(alembic_config()).get_revision(revision).down_revision
+    queries = [q for q in HOT_QUERIES if q.revision == revision]
+
+    with scratch_db() as engine:
+        migrate(engine, down_revision)
+        if revision == "0002_season_stat_tables":
+            create_handmade_season_tables(engine)
+        seed(engine)
+
+        with engine.connect() as conn:
+            for q in queries:
+                res = explain(conn, q)
+                assert res is not None, f"{q.table} is empty; the plan was not checked"
+                assert not res.ok, f"{q.name}: already uses key={res.key} before {revision}"
+
+        migrate(engine, revision)
+        analyze(engine)
+
+        with engine.connect() as conn:
+            for q in queries:
+                res = explain(conn, q)
+                assert res is not None, f"{q.table} is empty; the plan was not checked"
+                assert res.ok, (
+                    f"{q.name}: expected an index on {q.leading_columns} after {revision}, "
+                    f"got key={res.key} ({res.key_columns}), plan={res.plan_row}"
+                )
+
+
+def test_season_tables_adopted_and_deduped_keeping_newest():
+    with scratch_db() as engine:
+        migrate(engine, "0001_baseline")
+        create_handmade_season_tables(engine)
+        with engine.begin() as conn:
+            conn.execute(sa.text("INSERT INTO teams (id, name) VALUES (1, 'Clemson')"))
+            conn.execute(sa.text("INSERT INTO players (id, team_id, first_name, last_name) VALUES (1, 1, 'Cam', 'Cannarella')"))
+            # What the ON DUPLICATE KEY UPDATE upsert appended without a key.
+            conn.execute(sa.text("""
+                INSERT INTO player_batting_season (id, player_id, season_year, hr)
+                VALUES (1, 1, 2025, 3), (2, 1, 2025, 4), (3, 1, 2025, 5), (4, 1, 2024, 9)
+            """))
+
+        migrate(engine, "0002_season_stat_tables")
+
+        with engine.connect() as conn:
+            rows = conn.execute(sa.text("SELECT id, season_year, hr FROM player_batting_season ORDER BY id")).all()
+            assert rows == [(3, 2025, 5), (4, 2024, 9)]
+            with pytest.raises(sa.exc.IntegrityError):
+                conn.execute(sa.text("INSERT INTO player_batting_season (player_id, season_year) VALUES (1, 2025)"))
+        assert {ix["name"] for ix in sa.inspect(engine).get_indexes("player_batting_season")} >= {
+            "uq_batting_season", "ix_batting_season_year",
+        }
+
+
+def test_players_unique_key_merges_existing_duplicates():
+    with scratch_db() as engine:
+        migrate(engine, "0002_season_stat_tables")
+        with engine.begin() as conn:
+            conn.execute(sa.text("INSERT INTO teams (id, name) VALUES (1, 'Clemson')"))
+            conn.execute(sa.text("""
+                INSERT INTO players (id, team_id, first_name, last_name)
+                VALUES (1, 1, 'Cam', 'Cannarella'), (2, 1, 'Cam', 'Cannarella'), (3, 1, 'Jarren', 'Purify')
+            """))
+            conn.execute(sa.text("INSERT INTO player_batting_season (player_id, season_year, hr) VALUES (2, 2025, 5)"))
+
+        migrate(engine, "head")
+
+        with engine.connect() as conn:
+            assert conn.execute(sa.text("SELECT id FROM players ORDER BY id")).scalars().all() == [1, 3]
+            assert conn.execute(sa.text("SELECT player_id, hr FROM player_batting_season")).all() == [(1, 5)]
+            with pytest.raises(sa.exc.IntegrityError):
+                conn.execute(sa.text("INSERT INTO players (team_id, first_name, last_name) VALUES (1, 'Cam', 'Cannarella')"))
+
+
+def test_downgrade_to_base_and_upgrade_again():
+    with scratch_db() as engine:
+        migrate(engine, "head")
+        migrate(engine, "base", downgrade=True)
+        assert sa.inspect(engine).get_table_names() == ["alembic_version"]
+        migrate(engine, "head")
+        assert {"players", "player_batting_season", "player_pitching_season"} <= set(sa.inspect(engine).get_table_names())
@@ -0,0 +1,81 @@
+"""Tests for etl.sources.raw_archive and etl.jobs.reprocess_archive."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from etl.sources.raw_archive import archive_page, iter_archived_pages, latest_pages, read_page
+
+HTML_PATH = Path(__file__).resolve().parents[1] / "etl" / "data" / "raw" / "d1baseball_clemson_2025_stats.html"
+FETCHED_AT = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def html():
+    return HTML_PATH.read_text(encoding="utf-8")
+
+
+def _archive(html, root, season_year=2025, fetched_at=FETCHED_AT):
+    return archive_page(html, "clemson", "Clemson", season_year, url="https://example.test", fetched_at=fetched_at, root=root)
+
+
+def test_same_page_twice_is_stored_once(html, tmp_path):
+    first = _archive(html, tmp_path)
+    second = _archive(html, tmp_path)
+
+    assert first == second
+    assert read_page(first) == html
+    assert sorted(p.name for p in first.parent.iterdir()) == sorted([first.name, first.name.replace(".html.gz", ".json")])
+    assert [p.sha256 for p in iter_archived_pages(tmp_path)] == [first.name.split(".")[0]]
+
+
+def test_missing_sidecar_is_repaired_on_next_write(html, tmp_path):
+    path = _archive(html, tmp_path)
+    sidecar = path.with_name(path.name.replace(".html.gz", ".json"))
+    sidecar.unlink()
+
+    assert _archive(html, tmp_path) == path
+    assert sidecar.exists()
+    [page] = iter_archived_pages(tmp_path)
+    assert (page.team_name, page.season_year, page.fetched_at) == ("Clemson", 2025, FETCHED_AT)
+
+
+def test_page_without_sidecar_is_skipped(html, tmp_path, caplog):
+    kept = _archive(html, tmp_path, season_year=2024)
+    orphan = _archive(html, tmp_path, season_year=2025)
+    orphan.with_name(orphan.name.replace(".html.gz", ".json")).unlink()
+
+    with caplog.at_level(logging.WARNING, logger="etl.sources.raw_archive"):
+        pages = list(iter_archived_pages(tmp_path))
+
+    assert [p.path for p in pages] == [kept]
+    assert str(orphan) in caplog.text
+
+
+def test_latest_pages_picks_newest_fetch(html, tmp_path):
+    _archive(html, tmp_path, fetched_at=FETCHED_AT)
+    newest = _archive(html.replace("Clemson", "Clemson ", 1), tmp_path, fetched_at=FETCHED_AT + timedelta(days=3))
+    _archive(html, tmp_path, season_year=2024)
+
+    latest = {p.season_year: p.path for p in latest_pages(list(iter_archived_pages(tmp_path)))}
+    assert list(latest) == [2024, 2025]
+    assert latest[2025] == newest
+
+
+def test_reprocess_serial_and_parallel_agree(html, tmp_path):
+    pytest.importorskip("pandas")
+    pytest.importorskip("bs4")
+    pytest.importorskip("lxml")
+    from etl.jobs.reprocess_archive import reprocess_archive
+
+    _archive(html, tmp_path, season_year=2024)
+    _archive(html, tmp_path, season_year=2025)
+
+    serial = list(reprocess_archive(tmp_path, workers=1))
+    parallel = list(reprocess_archive(tmp_path, workers=2))
+
+    assert [r.error for r in serial] == [None, None]
+    assert [(r.page, r.batting, r.pitching) for r in serial] == [(r.page, r.batting, r.pitching) for r in parallel]
+    assert [(len(r.batting), len(r.pitching)) for r in serial] == [(16, 22), (16, 22)]
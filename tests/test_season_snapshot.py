@@ -0,0 +1,117 @@
+"""Round-trip tests for etl.load.season_snapshot."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from etl.load.season_snapshot import INT_NULL, open_season_table, write_season_snapshot
+
+BATTING = [
+    {"team": "Clemson", "player_first": "Cam", "player_last": "Cannarella", "class_year": "JR", "pos": "CF",
+     "ba": 0.353, "hr": 5, "2b": 22},
+    {"team": "Duke", "player_first": "Ada", "player_last": None, "class_year": None, "pos": None,
+     "ba": None, "hr": None, "2b": 3},
+    {"team": "Clemson", "player_first": "Dominic", "player_last": "Listi", "class_year": "SR", "pos": "LF",
+     "ba": 0.310, "hr": 5, "2b": None},
+]
+PITCHING = [
+    {"team": "Clemson", "player_first": "Aidan", "player_last": "Knaak", "class_year": "JR",
+     "era": 3.41, "outs_recorded": 271, "ba_against": None},
+]
+
+
+@pytest.fixture
+def snapshot_root(tmp_path):
+    write_season_snapshot(2025, BATTING, PITCHING, root=tmp_path)
+    return tmp_path
+
+
+def test_numeric_columns_round_trip_with_nulls(snapshot_root):
+    bat = open_season_table(2025, "batting", root=snapshot_root)
+    assert bat.n_rows == 3
+
+    hr = bat.column("hr")
+    assert hr.dtype == np.int32
+    assert isinstance(hr, np.memmap)
+    assert hr.tolist() == [5, INT_NULL, 5]
+    assert bat.column("2b").tolist() == [22, 3, INT_NULL]
+
+    ba = bat.column("ba")
+    assert ba.dtype == np.float64
+    assert ba[0] == pytest.approx(0.353)
+    assert math.isnan(ba[1])
+
+    # Columns that no record carries are all-null.
+    assert (bat.column("rbi") == INT_NULL).all()
+    assert np.isnan(bat.column("ops")).all()
+
+
+def test_string_columns_use_sorted_dictionary(snapshot_root):
+    bat = open_season_table(2025, "batting", root=snapshot_root)
+
+    assert bat.dictionary("team").tolist() == ["Clemson", "Duke"]
+    assert bat.codes("team").tolist() == [0, 1, 0]
+    assert bat.dictionary("pos").tolist() == ["CF", "LF"]
+    assert bat.codes("pos").tolist() == [0, -1, 1]
+
+    assert bat.column("player_last").tolist() == ["Cannarella", None, "Listi"]
+    assert bat.column("class_year").tolist() == ["JR", None, "SR"]
+
+    with pytest.raises(ValueError):
+        bat.codes("hr")
+
+
+def test_to_pandas_maps_nulls(snapshot_root):
+    pytest.importorskip("pandas")
+    import pandas as pd
+
+    df = open_season_table(2025, "batting", root=snapshot_root).to_pandas(["team", "pos", "hr", "ba"])
+    assert list(df.columns) == ["team", "pos", "hr", "ba"]
+    assert str(df["hr"].dtype) == "Int32"
+    assert df["hr"].isna().tolist() == [False, True, False]
+    assert df["hr"].iloc[0] == 5
+    assert df["ba"].isna().tolist() == [False, True, False]
+    assert isinstance(df["team"].dtype, pd.CategoricalDtype)
+    assert df["team"].tolist() == ["Clemson", "Duke", "Clemson"]
+    assert df["pos"].isna().tolist() == [False, True, False]
+
+
+def test_pitching_table_and_rewrite(snapshot_root):
+    pit = open_season_table(2025, "pitching", root=snapshot_root)
+    assert pit.n_rows == 1
+    assert pit.column("outs_recorded").tolist() == [271]
+    assert math.isnan(pit.column("ba_against")[0])
+
+    write_season_snapshot(2025, BATTING[:1], [], root=snapshot_root)
+    assert open_season_table(2025, "batting", root=snapshot_root).n_rows == 1
+    assert open_season_table(2025, "pitching", root=snapshot_root).n_rows == 0
+
+
+def test_reader_opened_before_rewrite_keeps_its_version(snapshot_root):
+    old = open_season_table(2025, "batting", root=snapshot_root)
+    write_season_snapshot(2025, BATTING + BATTING[:1], PITCHING, root=snapshot_root)
+
+    # The old reader still sees a consistent 3-row table, every column.
+    assert old.n_rows == 3
+    assert old.column("hr").tolist() == [5, INT_NULL, 5]
+    assert old.column("team").tolist() == ["Clemson", "Duke", "Clemson"]
+
+    new = open_season_table(2025, "batting", root=snapshot_root)
+    assert new.n_rows == 4
+    assert new.column("team").tolist() == ["Clemson", "Duke", "Clemson", "Clemson"]
+
+    # Only the current version is kept on disk.
+    season_dir = snapshot_root / "season=2025"
+    assert [p.name for p in season_dir.iterdir() if p.is_dir()] == [new.dir.parent.name]
+
+
+def test_missing_season(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_season_table(2025, "batting", root=tmp_path)
+
+
+def test_unknown_table(snapshot_root):
+    with pytest.raises(ValueError):
+        open_season_table(2025, "fielding", root=snapshot_root)